@@ -1,4 +1,6 @@
-from .hash import hash_elems
+from typing import Iterable, List, Tuple
+
+from .hash import hash_elems, hash_elems_prefixed
 from .group import ElementModQ
 
 
@@ -28,3 +30,18 @@ def get_ballot_code(
     :return: code
     """
     return hash_elems(prev_code, timestamp, ballot_hash)
+
+
+def get_ballot_codes(
+    prev_code: ElementModQ, ballots: Iterable[Tuple[int, ElementModQ]]
+) -> List[ElementModQ]:
+    """
+    Get the rotated codes for a batch of ballots sharing the same previous code.
+    Equivalent to calling `get_ballot_code` for each ballot, but the previous
+    code is only hashed once.
+    :param prev_code: Previous code or starting hash from device
+    :param ballots: Timestamp in ticks and hash of each ballot
+    :return: codes in the order of the ballots
+    """
+    get_code = hash_elems_prefixed(prev_code)
+    return [get_code(timestamp, ballot_hash) for (timestamp, ballot_hash) in ballots]
@@ -391,11 +391,15 @@ class Guardian:
 
     def share_election_partial_key_backups(self) -> List[ElectionPartialKeyBackup]:
         """
-        Share all election partial key backups.
+        Share all election partial key backups designated for other guardians.
 
-        :return: Election partial key backup or None
+        :return: Election partial key backups
         """
-        return list(self._backups_to_share.values())
+        return [
+            backup
+            for backup in self._backups_to_share.values()
+            if backup.designated_id != self.id
+        ]
 
     def save_election_partial_key_backup(
         self, backup: ElectionPartialKeyBackup
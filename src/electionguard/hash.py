@@ -3,6 +3,7 @@ from abc import abstractmethod
 from collections.abc import Sequence
 from hashlib import sha256
 from typing import (
+    Callable,
     Iterable,
     List,
     Union,
@@ -73,33 +74,61 @@ def hash_elems(*a: CRYPTO_HASHABLE_ALL) -> ElementModQ:
     h = sha256()
     h.update("|".encode("utf-8"))
     for x in a:
-        # We could just use str(x) for everything, but then we'd have a resulting string
-        # that's a bit Python-specific, and we'd rather make it easier for other languages
-        # to exactly match this hash function.
-
-        if isinstance(x, (ElementModP, ElementModQ)):
-            hash_me = x.to_hex()
-        elif isinstance(x, CryptoHashable):
-            hash_me = x.crypto_hash().to_hex()
-        elif isinstance(x, str):
-            # strings are iterable, so it's important to handle them before list-like types
-            hash_me = x
-        elif isinstance(x, int):
-            hash_me = str(x)
-        elif not x:
-            # This case captures empty lists and None, nicely guaranteeing that we don't
-            # need to do a recursive call if the list is empty. So we need a string to
-            # feed in for both of these cases. "None" would be a Python-specific thing,
-            # so we'll go with the more JSON-ish "null".
-            hash_me = "null"
-        elif isinstance(x, (Sequence, List, Iterable)):
-            # The simplest way to deal with lists, tuples, and such are to crunch them recursively.
-            hash_me = hash_elems(*x).to_hex()
-        else:
-            hash_me = str(x)
-
-        h.update((hash_me + "|").encode("utf-8"))
+        h.update((_hash_elem(x) + "|").encode("utf-8"))
 
     # We don't need the checked version of int_to_q, because the
     # modulo operation here guarantees that we're in bounds.
     return int_to_q_unchecked(int.from_bytes(h.digest(), byteorder="big") % Q_MINUS_ONE)
+
+
+def hash_elems_prefixed(*prefix: CRYPTO_HASHABLE_ALL) -> Callable[..., ElementModQ]:
+    """
+    Given zero or more leading elements, hash them once and get a function
+    that completes the hash with the remaining elements, such that
+    `hash_elems_prefixed(a)(b, c) == hash_elems(a, b, c)`.
+
+    :param prefix: Zero or more leading elements of any of the types accepted by `hash_elems`.
+    :return: A function calculating the cryptographic hash of the prefix and its arguments.
+    """
+    prefix_hash = sha256()
+    prefix_hash.update("|".encode("utf-8"))
+    for x in prefix:
+        prefix_hash.update((_hash_elem(x) + "|").encode("utf-8"))
+
+    def hash_rest(*a: CRYPTO_HASHABLE_ALL) -> ElementModQ:
+        h = prefix_hash.copy()
+        for x in a:
+            h.update((_hash_elem(x) + "|").encode("utf-8"))
+        return int_to_q_unchecked(
+            int.from_bytes(h.digest(), byteorder="big") % Q_MINUS_ONE
+        )
+
+    return hash_rest
+
+
+def _hash_elem(x: CRYPTO_HASHABLE_ALL) -> str:
+    # We could just use str(x) for everything, but then we'd have a resulting string
+    # that's a bit Python-specific, and we'd rather make it easier for other languages
+    # to exactly match this hash function.
+
+    if isinstance(x, (ElementModP, ElementModQ)):
+        hash_me = x.to_hex()
+    elif isinstance(x, CryptoHashable):
+        hash_me = x.crypto_hash().to_hex()
+    elif isinstance(x, str):
+        # strings are iterable, so it's important to handle them before list-like types
+        hash_me = x
+    elif isinstance(x, int):
+        hash_me = str(x)
+    elif not x:
+        # This case captures empty lists and None, nicely guaranteeing that we don't
+        # need to do a recursive call if the list is empty. So we need a string to
+        # feed in for both of these cases. "None" would be a Python-specific thing,
+        # so we'll go with the more JSON-ish "null".
+        hash_me = "null"
+    elif isinstance(x, (Sequence, List, Iterable)):
+        # The simplest way to deal with lists, tuples, and such are to crunch them recursively.
+        hash_me = hash_elems(*x).to_hex()
+    else:
+        hash_me = str(x)
+    return hash_me
@@ -1,4 +1,4 @@
-from typing import Dict, Iterable, List, NamedTuple, Optional
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 from .key_ceremony import (
     AuxiliaryPublicKey,
     CeremonyDetails,
@@ -26,44 +26,100 @@ class BackupVerificationState(NamedTuple):
 
     all_sent: bool = False
     all_verified: bool = False
-    failed_verifications: List[GuardianPair] = []
+    failed_verifications: Tuple[GuardianPair, ...] = ()
 
 
+# Shared state for every check made before all verifications are received
+_EMPTY_VERIFICATION_STATE = BackupVerificationState()
+
+
+def _pair_key(owner_id: GUARDIAN_ID, designated_id: GUARDIAN_ID) -> str:
+    """
+    Key for a pair of guardians used internally to index by guardian pair
+    :param owner_id: Sending guardian id
+    :param designated_id: Designated guardian id
+    :return: Key joining both guardian ids
+    """
+    return owner_id + "\x1f" + designated_id
+
+
+# pylint: disable=too-many-instance-attributes
 class KeyCeremonyMediator:
     """
     KeyCeremonyMediator for assisting communication between guardians
     """
 
+    __slots__ = (
+        "id",
+        "ceremony_details",
+        "_required_guardians",
+        "_required_backups_total",
+        "_auxiliary_public_keys",
+        "_election_public_keys",
+        "_election_partial_key_backups",
+        "_backups_by_designated",
+        "_all_backups_cached_list",
+        "_election_partial_key_verifications",
+        "_failed_verifications",
+        "_election_partial_key_challenges",
+        "_announced_complete",
+        "_backups_complete",
+        "_verifications_complete",
+        "_verification_state_cache",
+    )
+
     id: MEDIATOR_ID
     ceremony_details: CeremonyDetails
 
+    # Expected counts derived from the ceremony details
+    _required_guardians: int
+    _required_backups_total: int
+
     # From Guardians
     # Round 1
     _auxiliary_public_keys: Dict[GUARDIAN_ID, AuxiliaryPublicKey]
     _election_public_keys: Dict[GUARDIAN_ID, ElectionPublicKey]
 
     # Round 2
-    _election_partial_key_backups: Dict[GuardianPair, ElectionPartialKeyBackup]
+    _election_partial_key_backups: Dict[str, ElectionPartialKeyBackup]
+    _backups_by_designated: Dict[GUARDIAN_ID, List[ElectionPartialKeyBackup]]
+    _all_backups_cached_list: Optional[List[ElectionPartialKeyBackup]]
 
     # Round 3
-    _election_partial_key_verifications: Dict[
-        GuardianPair, ElectionPartialKeyVerification
-    ]
+    _election_partial_key_verifications: Dict[str, ElectionPartialKeyVerification]
+    _failed_verifications: Dict[str, GuardianPair]
+
+    # Round 4
+    _election_partial_key_challenges: Dict[str, ElectionPartialKeyChallenge]
+
+    # Completion of each round, updated as keys are received
+    _announced_complete: bool
+    _backups_complete: bool
+    _verifications_complete: bool
+    _verification_state_cache: Optional[BackupVerificationState]
 
     def __init__(self, id: MEDIATOR_ID, ceremony_details: CeremonyDetails):
         self.id = id
         self.ceremony_details = ceremony_details
+        self._set_required_counts()
         self._auxiliary_public_keys: Dict[GUARDIAN_ID, AuxiliaryPublicKey] = {}
         self._election_public_keys: Dict[GUARDIAN_ID, ElectionPublicKey] = {}
-        self._election_partial_key_backups: Dict[
-            GuardianPair, ElectionPartialKeyBackup
+        self._election_partial_key_backups: Dict[str, ElectionPartialKeyBackup] = {}
+        self._backups_by_designated: Dict[
+            GUARDIAN_ID, List[ElectionPartialKeyBackup]
         ] = {}
+        self._all_backups_cached_list = None
         self._election_partial_key_verifications: Dict[
-            GuardianPair, ElectionPartialKeyVerification
+            str, ElectionPartialKeyVerification
         ] = {}
+        self._failed_verifications: Dict[str, GuardianPair] = {}
         self._election_partial_key_challenges: Dict[
-            GuardianPair, ElectionPartialKeyChallenge
+            str, ElectionPartialKeyChallenge
         ] = {}
+        self._announced_complete = False
+        self._backups_complete = False
+        self._verifications_complete = False
+        self._verification_state_cache = None
 
     # ROUND 1: Announce guardians with public keys
     def announce(self, public_key_set: PublicKeySet) -> None:
@@ -79,10 +135,7 @@ class KeyCeremonyMediator:
         Check the annoucement of all the guardians expected
         :return: True if all guardians in attendance are announced
         """
-        return (
-            self._all_auxiliary_public_keys_available()
-            and self._all_election_public_keys_available()
-        )
+        return self._announced_complete
 
     def share_announced(
         self, requesting_guardian_id: Optional[GUARDIAN_ID] = None
@@ -119,10 +172,7 @@ class KeyCeremonyMediator:
         Check the availability of all the guardians backups
         :return: True if all guardians have sent backups
         """
-        return (
-            self.all_guardians_announced()
-            and self._all_election_partial_key_backups_available()
-        )
+        return self._announced_complete and self._backups_complete
 
     def share_backups(
         self, requesting_guardian_id: Optional[GUARDIAN_ID] = None
@@ -130,10 +180,14 @@ class KeyCeremonyMediator:
         """
         Share all backups designated for a specific guardian
         """
-        if not self.all_guardians_announced() or not self.all_backups_available:
+        if not self.all_backups_available():
             return None
         if not requesting_guardian_id:
-            return list(self._election_partial_key_backups.values())
+            if self._all_backups_cached_list is None:
+                self._all_backups_cached_list = list(
+                    self._election_partial_key_backups.values()
+                )
+            return list(self._all_backups_cached_list)
         return self._share_election_partial_key_backups_to_guardian(
             requesting_guardian_id
         )
@@ -151,11 +205,8 @@ class KeyCeremonyMediator:
             self._receive_election_partial_key_verification(verification)
 
     def get_verification_state(self) -> BackupVerificationState:
-        if (
-            not self.all_backups_available()
-            or not self._all_election_partial_key_verifications_received()
-        ):
-            return BackupVerificationState()
+        if not self.all_backups_available() or not self._verifications_complete:
+            return _EMPTY_VERIFICATION_STATE
         return self._check_verification_of_election_partial_key_backups()
 
     def all_backups_verified(self) -> bool:
@@ -190,11 +241,28 @@ class KeyCeremonyMediator:
         :param ceremony_details: Ceremony details of election
         """
         self.ceremony_details = ceremony_details
+        self._set_required_counts()
         self._auxiliary_public_keys = {}
         self._election_public_keys = {}
         self._election_partial_key_backups = {}
+        self._backups_by_designated = {}
+        self._all_backups_cached_list = None
         self._election_partial_key_challenges = {}
         self._election_partial_key_verifications = {}
+        self._failed_verifications = {}
+        self._announced_complete = False
+        self._backups_complete = False
+        self._verifications_complete = False
+        self._verification_state_cache = None
+
+    def _set_required_counts(self) -> None:
+        """
+        Compute the expected number of guardians and backups from the ceremony details
+        """
+        number_of_guardians = self.ceremony_details.number_of_guardians
+        self._required_guardians = number_of_guardians
+        # Each guardian shares a backup with every other guardian
+        self._required_backups_total = number_of_guardians * (number_of_guardians - 1)
 
     # Auxiliary Public Keys
     def _receive_auxiliary_public_key(self, public_key: AuxiliaryPublicKey) -> None:
@@ -202,17 +270,17 @@ class KeyCeremonyMediator:
         Receive auxiliary public key from guardian
         :param public_key: Auxiliary public key
         """
+        if public_key.owner_id in self._auxiliary_public_keys:
+            return
         self._auxiliary_public_keys[public_key.owner_id] = public_key
+        self._update_announced_complete()
 
     def _all_auxiliary_public_keys_available(self) -> bool:
         """
         True if all auxiliary public key for all guardians available
         :return: All auxiliary public backups for all guardians available
         """
-        return (
-            len(self._auxiliary_public_keys)
-            == self.ceremony_details.number_of_guardians
-        )
+        return len(self._auxiliary_public_keys) == self._required_guardians
 
     # Election Public Keys
     def _receive_election_public_key(self, public_key: ElectionPublicKey) -> None:
@@ -220,15 +288,25 @@ class KeyCeremonyMediator:
         Receive election public key from guardian
         :param public_key: election public key
         """
+        if public_key.owner_id in self._election_public_keys:
+            return
         self._election_public_keys[public_key.owner_id] = public_key
+        self._update_announced_complete()
 
     def _all_election_public_keys_available(self) -> bool:
         """
         True if all election public keys for all guardians available
         :return: All election public keys for all guardians available
         """
-        return (
-            len(self._election_public_keys) == self.ceremony_details.number_of_guardians
+        return len(self._election_public_keys) == self._required_guardians
+
+    def _update_announced_complete(self) -> None:
+        """
+        Cache whether all guardians have announced both of their public keys
+        """
+        self._announced_complete = (
+            self._all_auxiliary_public_keys_available()
+            and self._all_election_public_keys_available()
         )
 
     def _get_announced_guardians(self) -> Iterable[GUARDIAN_ID]:
@@ -243,22 +321,23 @@ class KeyCeremonyMediator:
         :param backup: Election partial key backup
         :return: boolean indicating success or failure
         """
-        if backup.owner_id == backup.designated_id:
+        assert (
+            backup.owner_id != backup.designated_id
+        ), "guardians do not share backups with themselves"
+        key = _pair_key(backup.owner_id, backup.designated_id)
+        if key in self._election_partial_key_backups:
             return
-        self._election_partial_key_backups[
-            GuardianPair(backup.owner_id, backup.designated_id)
-        ] = backup
+        self._election_partial_key_backups[key] = backup
+        self._backups_by_designated.setdefault(backup.designated_id, []).append(backup)
+        self._all_backups_cached_list = None
+        self._backups_complete = self._all_election_partial_key_backups_available()
 
     def _all_election_partial_key_backups_available(self) -> bool:
         """
         True if all election partial key backups for all guardians available
         :return: All election partial key backups for all guardians available
         """
-        required_backups_per_guardian = self.ceremony_details.number_of_guardians - 1
-        return (
-            len(self._election_partial_key_backups)
-            == required_backups_per_guardian * self.ceremony_details.number_of_guardians
-        )
+        return len(self._election_partial_key_backups) == self._required_backups_total
 
     def _share_election_partial_key_backups_to_guardian(
         self, guardian_id: GUARDIAN_ID
@@ -268,15 +347,7 @@ class KeyCeremonyMediator:
         :param guardian_id: Recipients guardian id
         :return: List of guardians designated backups
         """
-        backups: List[ElectionPartialKeyBackup] = []
-        for current_guardian_id in self._get_announced_guardians():
-            if guardian_id != current_guardian_id:
-                backup = self._election_partial_key_backups[
-                    GuardianPair(current_guardian_id, guardian_id)
-                ]
-                if backup is not None:
-                    backups.append(backup)
-        return backups
+        return list(self._backups_by_designated.get(guardian_id, ()))
 
     # Partial Key Verifications
     def _receive_election_partial_key_verification(
@@ -286,24 +357,33 @@ class KeyCeremonyMediator:
         Receive election partial key verification from guardian
         :param verification: Election partial key verification
         """
-        if verification.owner_id == verification.designated_id:
+        assert (
+            verification.owner_id != verification.designated_id
+        ), "guardians do not verify their own backups"
+        key = _pair_key(verification.owner_id, verification.designated_id)
+        # A different verification for the pair may replace a failed one after a challenge
+        if self._election_partial_key_verifications.get(key) == verification:
             return
-        self._election_partial_key_verifications[
-            GuardianPair(verification.owner_id, verification.designated_id)
-        ] = verification
+        self._election_partial_key_verifications[key] = verification
+        if verification.verified:
+            self._failed_verifications.pop(key, None)
+        else:
+            self._failed_verifications[key] = GuardianPair(
+                verification.owner_id, verification.designated_id
+            )
+        self._verification_state_cache = None
+        self._verifications_complete = (
+            self._all_election_partial_key_verifications_received()
+        )
 
     def _all_election_partial_key_verifications_received(self) -> bool:
         """
         True if all election partial key verifications recieved
         :return: All election partial key verifications received
         """
-        required_verifications_per_guardian = (
-            self.ceremony_details.number_of_guardians - 1
-        )
         return (
             len(self._election_partial_key_verifications)
-            == required_verifications_per_guardian
-            * self.ceremony_details.number_of_guardians
+            == self._required_backups_total
         )
 
     def _check_verification_of_election_partial_key_backups(
@@ -313,15 +393,16 @@ class KeyCeremonyMediator:
         True if all election partial key backups verified
         :return: All election partial key backups verified
         """
-        if not self._all_election_partial_key_verifications_received():
-            return BackupVerificationState()
-        failed_verifications: List[GuardianPair] = []
-        for verification in self._election_partial_key_verifications.values():
-            if not verification.verified:
-                failed_verifications.append(
-                    GuardianPair(verification.owner_id, verification.designated_id)
-                )
-
-        return BackupVerificationState(
-            True, len(failed_verifications) == 0, failed_verifications
-        )
+        if not self._verifications_complete:
+            return _EMPTY_VERIFICATION_STATE
+        if self._verification_state_cache is not None:
+            return self._verification_state_cache
+
+        if not self._failed_verifications:
+            state = BackupVerificationState(True, True)
+        else:
+            state = BackupVerificationState(
+                True, False, tuple(self._failed_verifications.values())
+            )
+        self._verification_state_cache = state
+        return state
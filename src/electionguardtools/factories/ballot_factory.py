@@ -1,20 +1,20 @@
-from typing import cast, TypeVar, Callable, List, Tuple
+from typing import Any, TypeVar, Callable, Dict, List, Optional, Tuple
+from functools import lru_cache
+import json
 import os
-from random import Random, randint
+from random import Random
 import uuid
 
-from jsons import KEY_TRANSFORMER_SNAKECASE, loads
-
 from hypothesis.strategies import (
     composite,
     booleans,
     integers,
     text,
-    uuids,
     SearchStrategy,
 )
 
 from electionguard.ballot import (
+    ExtendedData,
     PlaintextBallot,
     PlaintextBallotContest,
     PlaintextBallotSelection,
@@ -25,6 +25,7 @@ from electionguard.manifest import (
     SelectionDescription,
     InternalManifest,
 )
+from electionguard.scheduler import Scheduler
 
 
 _T = TypeVar("_T")
@@ -32,6 +33,15 @@ _DrawType = Callable[[SearchStrategy[_T]], _T]
 
 data = os.path.realpath(os.path.join(__file__, "../../../data"))
 
+# Ballot files may use camel case keys
+_SNAKE_CASE_KEYS = {
+    "objectId": "object_id",
+    "styleId": "style_id",
+    "ballotSelections": "ballot_selections",
+    "isPlaceholderSelection": "is_placeholder_selection",
+    "extendedData": "extended_data",
+}
+
 
 class BallotFactory:
     """Factory to create ballots"""
@@ -46,7 +56,7 @@ class BallotFactory:
         is_placeholder=False,
     ) -> PlaintextBallotSelection:
 
-        selected = bool(random_source.randint(0, 1))
+        selected = bool(random_source.getrandbits(1))
         return selection_from(description, is_placeholder, selected)
 
     def get_random_contest_from(
@@ -70,19 +80,24 @@ class BallotFactory:
         voted = 0
 
         for selection_description in description.ballot_selections:
-            selection = self.get_random_selection_from(selection_description, random)
+            # Draw the vote, whether to include it and whether to include
+            # an explicit false before constructing any selection
+            bits = random.getrandbits(3)
+            vote = bits & 1
+            voted += vote
             # the caller may force a true value
-            voted += selection.vote
-            if voted <= 1 and selection.vote and with_trues:
-                selections.append(selection)
+            if voted <= 1 and vote and with_trues:
+                selections.append(selection_from(selection_description, False, True))
                 continue
 
             # Possibly append the true selection, indicating an undervote
-            if voted <= description.number_elected and bool(random.randint(0, 1)) == 1:
-                selections.append(selection)
+            if voted <= description.number_elected and bits & 2:
+                selections.append(
+                    selection_from(selection_description, False, bool(vote))
+                )
             # Possibly append the false selections as well, indicating some choices
             # may be explicitly false
-            elif bool(random.randint(0, 1)) == 1:
+            elif bits & 4:
                 selections.append(selection_from(selection_description))
 
         return PlaintextBallotContest(description.object_id, selections)
@@ -115,23 +130,81 @@ class BallotFactory:
         return fake_ballot
 
     def generate_fake_plaintext_ballots_for_election(
-        self, internal_manifest: InternalManifest, number_of_ballots: int
+        self,
+        internal_manifest: InternalManifest,
+        number_of_ballots: int,
+        scheduler: Optional[Scheduler] = None,
+        seed: Optional[int] = None,
     ) -> List[PlaintextBallot]:
-        ballots: List[PlaintextBallot] = []
+        """
+        Generate fake ballots for random ballot styles of the election.
+        Each ballot is generated from its own seed drawn from a single
+        source of randomness.
+        :param scheduler: the scheduler to generate the ballots in parallel with,
+            the ballots are generated in process if not provided
+        :param seed: seed for the source of randomness, the ballots
+            (including their ids) are reproducible for the same seed
+        :return: the list of fake ballots
+        """
+        random = Random(seed)
+        contests_by_style: Dict[str, List[ContestDescription]] = {
+            ballot_style.object_id: list(
+                internal_manifest.get_contests_for(ballot_style.object_id)
+            )
+            for ballot_style in internal_manifest.ballot_styles
+        }
+
+        # Validate the contests once here rather than for every ballot,
+        # since failures in the workers are not raised
+        for contests in contests_by_style.values():
+            for contest in contests:
+                assert contest.is_valid(), "the contest description must be valid"
+
+        fake_ballots: List[Tuple[str, str, int]] = []
         for _i in range(number_of_ballots):
 
-            style_index = randint(0, len(internal_manifest.ballot_styles) - 1)
+            style_index = random.randint(0, len(internal_manifest.ballot_styles) - 1)
             ballot_style = internal_manifest.ballot_styles[style_index]
-            ballot_id = f"ballot-{uuid.uuid1()}"
-
-            contests: List[PlaintextBallotContest] = []
-            for contest in internal_manifest.get_contests_for(ballot_style.object_id):
-                contests.append(
-                    self.get_random_contest_from(contest, Random(), with_trues=True)
-                )
+            ballot_id = f"ballot-{uuid.UUID(int=random.getrandbits(128), version=4)}"
+            fake_ballots.append(
+                (ballot_style.object_id, ballot_id, random.getrandbits(64))
+            )
 
-            ballots.append(PlaintextBallot(ballot_id, ballot_style.object_id, contests))
+        # Opening a process pool costs more than generating a few ballots
+        if scheduler is None:
+            return self._get_fake_plaintext_ballots(contests_by_style, fake_ballots)
+
+        # Send the contests once per chunk of ballots rather than once per ballot
+        chunk_size = max(1, -(-number_of_ballots // scheduler.cpu_count()))
+        arguments = [
+            (contests_by_style, fake_ballots[index : index + chunk_size])
+            for index in range(0, number_of_ballots, chunk_size)
+        ]
+
+        ballots: List[PlaintextBallot] = [
+            ballot
+            for chunk in scheduler.schedule(self._get_fake_plaintext_ballots, arguments)
+            for ballot in chunk
+        ]
+        if len(ballots) != number_of_ballots:
+            raise RuntimeError("failed to generate all of the fake ballots")
+        return ballots
 
+    def _get_fake_plaintext_ballots(
+        self,
+        contests_by_style: Dict[str, List[ContestDescription]],
+        fake_ballots: List[Tuple[str, str, int]],
+    ) -> List[PlaintextBallot]:
+        ballots: List[PlaintextBallot] = []
+        for (style_id, ballot_id, seed) in fake_ballots:
+            random = Random(seed)
+            contests = [
+                self.get_random_contest_from(
+                    contest, random, suppress_validity_check=True, with_trues=True
+                )
+                for contest in contests_by_style[style_id]
+            ]
+            ballots.append(PlaintextBallot(ballot_id, style_id, contests))
         return ballots
 
     def get_simple_ballot_from_file(self) -> PlaintextBallot:
@@ -142,52 +215,74 @@ class BallotFactory:
 
     @staticmethod
     def _get_ballot_from_file(filename: str) -> PlaintextBallot:
-        with open(os.path.join(data, filename), "r") as subject:
-            result = subject.read()
-            target = PlaintextBallot.from_json(result)
-        return target
+        return _ballot_from_dict(_load_json_cached(os.path.join(data, filename)))
 
     @staticmethod
     def _get_ballots_from_file(filename: str) -> List[PlaintextBallot]:
-        with open(os.path.join(data, filename), "r") as subject:
-            result = subject.read()
-            target = cast(
-                List[PlaintextBallot],
-                loads(
-                    result,
-                    List[PlaintextBallot],
-                    key_transformer=KEY_TRANSFORMER_SNAKECASE,
-                ),
-            )
-        return target
+        return [
+            _ballot_from_dict(ballot)
+            for ballot in _load_json_cached(os.path.join(data, filename))
+        ]
 
 
-@composite
-def get_selection_well_formed(
-    draw: _DrawType, ids=uuids(), bools=booleans(), txt=text(), vote=integers(0, 1)
-) -> Tuple[str, PlaintextBallotSelection]:
-    use_none = draw(bools)
-    if use_none:
-        extra_data = None
-    else:
-        extra_data = draw(txt)
-    object_id = f"selection-{draw(ids)}"
-    return (
-        object_id,
-        PlaintextBallotSelection(object_id, draw(vote), draw(bools), extra_data),
+@lru_cache(maxsize=None)
+def _load_json_cached(path: str) -> Any:
+    """
+    Load the parsed json of a file once per path.
+    The parsed values are shared between callers and are only read to build new ballots.
+    """
+    with open(path, "r") as subject:
+        return json.load(subject)
+
+
+def _snake_case_keys(values: Dict[str, Any]) -> Dict[str, Any]:
+    return {_SNAKE_CASE_KEYS.get(key, key): value for key, value in values.items()}
+
+
+def _ballot_from_dict(values: Dict[str, Any]) -> PlaintextBallot:
+    values = _snake_case_keys(values)
+    return PlaintextBallot(
+        values["object_id"],
+        values["style_id"],
+        [_contest_from_dict(contest) for contest in values["contests"]],
+    )
+
+
+def _contest_from_dict(values: Dict[str, Any]) -> PlaintextBallotContest:
+    values = _snake_case_keys(values)
+    return PlaintextBallotContest(
+        values["object_id"],
+        [_selection_from_dict(selection) for selection in values["ballot_selections"]],
+    )
+
+
+def _selection_from_dict(values: Dict[str, Any]) -> PlaintextBallotSelection:
+    values = _snake_case_keys(values)
+    extended_data = values.get("extended_data")
+    return PlaintextBallotSelection(
+        values["object_id"],
+        values["vote"],
+        values.get("is_placeholder_selection", False),
+        None
+        if extended_data is None
+        else ExtendedData(extended_data["value"], extended_data["length"]),
     )
 
 
 @composite
-def get_selection_poorly_formed(
-    draw: _DrawType, ids=uuids(), bools=booleans(), txt=text(), vote=integers(0, 1)
+def get_selection(
+    draw: _DrawType,
+    ids=integers(min_value=0),
+    bools=booleans(),
+    txt=text(),
+    vote=integers(0, 1),
 ) -> Tuple[str, PlaintextBallotSelection]:
     use_none = draw(bools)
     if use_none:
         extra_data = None
     else:
         extra_data = draw(txt)
-    object_id = f"selection-{draw(ids)}"
+    object_id = f"selection-{draw(ids):016x}"
     return (
         object_id,
         PlaintextBallotSelection(object_id, draw(vote), draw(bools), extra_data),
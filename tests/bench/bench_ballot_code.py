@@ -0,0 +1,59 @@
+from timeit import default_timer as timer
+from typing import Dict, List, Tuple
+
+from electionguard.ballot_code import (
+    get_ballot_code,
+    get_ballot_codes,
+    get_hash_for_device,
+)
+from electionguard.group import ElementModQ, int_to_q_unchecked
+from electionguard.nonces import Nonces
+
+
+def rotate_single(
+    prev_code: ElementModQ, ballots: List[Tuple[int, ElementModQ]]
+) -> List[ElementModQ]:
+    """Rotate the ballot code for each ballot one call at a time."""
+    return [
+        get_ballot_code(prev_code, timestamp, ballot_hash)
+        for (timestamp, ballot_hash) in ballots
+    ]
+
+
+if __name__ == "__main__":
+    problem_sizes = (100, 1000, 10000, 100000)
+    rands = Nonces(int_to_q_unchecked(31337))
+    device_hash = get_hash_for_device(1234, 5678, 9012, "polling-place")
+    speedup: Dict[int, float] = {}
+
+    bench_start = timer()
+
+    for size in problem_sizes:
+        print("Benchmarking on problem size: ", size)
+        inputs = [(1000 + i, rands[i]) for i in range(size)]
+
+        start_single = timer()
+        single_codes = rotate_single(device_hash, inputs)
+        end_single = timer()
+
+        start_batch = timer()
+        batch_codes = get_ballot_codes(device_hash, inputs)
+        end_batch = timer()
+
+        if single_codes != batch_codes:
+            raise Exception("Batched ballot codes differ from single rotations!")
+
+        print(f"  Single rotation = {end_single - start_single:.6f} sec")
+        print(f"  Batch rotation  = {end_batch - start_batch:.6f} sec")
+        speedup[size] = (end_single - start_single) / (end_batch - start_batch)
+        print(f"  Batch speedup: {speedup[size]:.3f}x")
+
+    print()
+    print("BATCH SPEEDUPS")
+    print("Size / Speedup")
+    for size in problem_sizes:
+        print(f"{size:6d} / {speedup[size]:.3f}x")
+
+    bench_end = timer()
+    print()
+    print(f"Total benchmark runtime: {bench_end - bench_start} sec")
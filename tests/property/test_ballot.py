@@ -38,7 +38,7 @@ class TestBallot(unittest.TestCase):
         suppress_health_check=[HealthCheck.too_slow],
         max_examples=10,
     )
-    @given(BallotFactory.get_selection_well_formed())
+    @given(BallotFactory.get_selection())
     def test_plaintext_ballot_selection_is_valid(
         self, subject: Tuple[str, PlaintextBallotSelection]
     ):
@@ -58,7 +58,7 @@ class TestBallot(unittest.TestCase):
         suppress_health_check=[HealthCheck.too_slow],
         max_examples=10,
     )
-    @given(BallotFactory.get_selection_poorly_formed())
+    @given(BallotFactory.get_selection())
     def test_plaintext_ballot_selection_is_invalid(
         self, subject: Tuple[str, PlaintextBallotSelection]
     ):
@@ -1,8 +1,9 @@
 from unittest import TestCase
 
-from electionguard.group import ZERO_MOD_Q, ONE_MOD_Q, TWO_MOD_Q
+from electionguard.group import ZERO_MOD_Q, ONE_MOD_Q, TWO_MOD_Q, int_to_q_unchecked
 from electionguard.ballot_code import (
     get_ballot_code,
+    get_ballot_codes,
     get_hash_for_device,
 )
 
@@ -36,3 +37,24 @@ class TestBallotCode(TestCase):
         self.assertNotEqual(ballot_code_1, device_hash)
         self.assertNotEqual(ballot_code_2, device_hash)
         self.assertNotEqual(ballot_code_1, ballot_code_2)
+
+    def test_rotate_ballot_codes_matches_single_rotation(self):
+        # Arrange
+        device = ElectionFactory.get_encryption_device()
+        device_hash = get_hash_for_device(
+            device.device_id, device.session_id, device.launch_code, device.location
+        )
+        ballots = [
+            (1000 * (i + 1), int_to_q_unchecked(i))
+            for i in (0, 1, 2, 0xFFFF, 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF)
+        ]
+
+        # Act
+        ballot_codes = get_ballot_codes(device_hash, ballots)
+
+        # Assert
+        self.assertEqual(len(ballot_codes), len(ballots))
+        for (timestamp, ballot_hash), ballot_code in zip(ballots, ballot_codes):
+            self.assertEqual(
+                ballot_code, get_ballot_code(device_hash, timestamp, ballot_hash)
+            )
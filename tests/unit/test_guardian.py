@@ -287,6 +287,25 @@ class TestGuardian(TestCase):
         self.assertEqual(key_backup.owner_id, SENDER_GUARDIAN_ID)
         self.assertEqual(key_backup.designated_id, RECIPIENT_GUARDIAN_ID)
 
+    def test_share_election_partial_key_backups(self):
+        # Arrange
+        guardian = Guardian(
+            SENDER_GUARDIAN_ID, SENDER_SEQUENCE_ORDER, NUMBER_OF_GUARDIANS, QUORUM
+        )
+        other_guardian = Guardian(
+            RECIPIENT_GUARDIAN_ID, RECIPIENT_SEQUENCE_ORDER, NUMBER_OF_GUARDIANS, QUORUM
+        )
+
+        # Act
+        guardian.save_auxiliary_public_key(other_guardian.share_auxiliary_public_key())
+        guardian.generate_election_partial_key_backups(identity_auxiliary_encrypt)
+        key_backups = guardian.share_election_partial_key_backups()
+
+        # Assert
+        self.assertEqual(len(key_backups), NUMBER_OF_GUARDIANS - 1)
+        self.assertEqual(key_backups[0].owner_id, SENDER_GUARDIAN_ID)
+        self.assertEqual(key_backups[0].designated_id, RECIPIENT_GUARDIAN_ID)
+
     def test_save_election_partial_key_backup(self):
         # Arrange
         guardian = Guardian(
@@ -26,9 +26,13 @@ class TestKeyCeremonyMediator(TestCase):
         # Arrange
         mediator = KeyCeremonyMediator("mediator_reset", CEREMONY_DETAILS)
         new_ceremony_details = CeremonyDetails(3, 3)
+        KeyCeremonyHelper.perform_round_1(GUARDIANS, mediator)
+        self.assertTrue(mediator.all_guardians_announced())
 
         mediator.reset(new_ceremony_details)
         self.assertEqual(mediator.ceremony_details, new_ceremony_details)
+        self.assertFalse(mediator.all_guardians_announced())
+        self.assertFalse(mediator.all_backups_available())
 
     def test_take_attendance(self):
         """Round 1: Mediator takes attendance and guardians announce"""
@@ -42,6 +46,19 @@ class TestKeyCeremonyMediator(TestCase):
         # Assert
         self.assertFalse(mediator.all_guardians_announced())
 
+        # Act
+        mediator.announce(GUARDIAN_1.share_public_keys())
+
+        # Assert
+        self.assertFalse(mediator.all_guardians_announced())
+
+        # Act
+        impostor = Guardian(GUARDIAN_1_ID, 1, NUMBER_OF_GUARDIANS, QUORUM)
+        mediator.announce(impostor.share_public_keys())
+
+        # Assert
+        self.assertFalse(mediator.all_guardians_announced())
+
         # Act
         mediator.announce(GUARDIAN_2.share_public_keys())
 
@@ -54,6 +71,8 @@ class TestKeyCeremonyMediator(TestCase):
         # Assert
         self.assertIsNotNone(guardian_key_sets)
         self.assertEqual(len(guardian_key_sets), NUMBER_OF_GUARDIANS)
+        self.assertIn(GUARDIAN_1.share_public_keys(), guardian_key_sets)
+        self.assertNotIn(impostor.share_public_keys(), guardian_key_sets)
 
     def test_exchange_of_backups(self):
         """Round 2: Exchange of election partial key backups"""
@@ -77,6 +96,7 @@ class TestKeyCeremonyMediator(TestCase):
 
         # Assert
         self.assertFalse(mediator.all_backups_available())
+        self.assertIsNone(mediator.share_backups())
 
         # Act
         mediator.receive_backups([backup_from_2_for_1])
@@ -87,8 +107,12 @@ class TestKeyCeremonyMediator(TestCase):
         # Act
         guardian1_backups = mediator.share_backups(GUARDIAN_1_ID)
         guardian2_backups = mediator.share_backups(GUARDIAN_2_ID)
+        all_backups = mediator.share_backups()
 
         # Assert
+        self.assertEqual(
+            len(all_backups), NUMBER_OF_GUARDIANS * (NUMBER_OF_GUARDIANS - 1)
+        )
         self.assertIsNotNone(guardian1_backups)
         self.assertIsNotNone(guardian2_backups)
         self.assertEqual(len(guardian1_backups), 1)
@@ -100,6 +124,44 @@ class TestKeyCeremonyMediator(TestCase):
         self.assertEqual(guardian1_backups[0], backup_from_2_for_1)
         self.assertEqual(guardian2_backups[0], backup_from_1_for_2)
 
+        # Act
+        all_backups.clear()
+
+        # Assert
+        self.assertEqual(
+            len(mediator.share_backups()),
+            NUMBER_OF_GUARDIANS * (NUMBER_OF_GUARDIANS - 1),
+        )
+
+    def test_receive_backups_ignores_repeated_pair(self):
+        """Round 2: A second backup for the same owner and designated guardian is ignored"""
+
+        # Arrange
+        mediator = KeyCeremonyMediator("mediator_repeated_backup", CEREMONY_DETAILS)
+        KeyCeremonyHelper.perform_round_1(GUARDIANS, mediator)
+        GUARDIAN_1.generate_election_partial_key_backups()
+        GUARDIAN_2.generate_election_partial_key_backups()
+        backup_from_1_for_2 = GUARDIAN_1.share_election_partial_key_backup(
+            GUARDIAN_2_ID
+        )
+        backup_from_2_for_1 = GUARDIAN_2.share_election_partial_key_backup(
+            GUARDIAN_1_ID
+        )
+        repeated_backup = backup_from_1_for_2._replace(encrypted_value="repeated")
+
+        # Act
+        mediator.receive_backups(
+            [backup_from_1_for_2, repeated_backup, backup_from_2_for_1]
+        )
+
+        # Assert
+        self.assertTrue(mediator.all_backups_available())
+        self.assertEqual(mediator.share_backups(GUARDIAN_2_ID), [backup_from_1_for_2])
+        self.assertEqual(
+            len(mediator.share_backups()),
+            NUMBER_OF_GUARDIANS * (NUMBER_OF_GUARDIANS - 1),
+        )
+
     # Partial Key Verifications
     def test_partial_key_backup_verification_success(self):
         """
@@ -184,3 +246,49 @@ class TestKeyCeremonyMediator(TestCase):
         self.assertEqual(len(new_state.failed_verifications), 0)
         self.assertTrue(all_verified)
         self.assertIsNotNone(joint_key)
+
+    def test_receive_backup_verifications_ignores_identical_verification(self):
+        """
+        Round 3: An identical verification for a pair is ignored, while a different
+        verification for the same pair replaces the stored one.
+        """
+        # Arrange
+        mediator = KeyCeremonyMediator(
+            "mediator_repeated_verification", CEREMONY_DETAILS
+        )
+        KeyCeremonyHelper.perform_round_1(GUARDIANS, mediator)
+        KeyCeremonyHelper.perform_round_2(GUARDIANS, mediator)
+        verification1 = GUARDIAN_1.verify_election_partial_key_backup(
+            GUARDIAN_2_ID, identity_auxiliary_decrypt
+        )
+        failed_verification2 = ElectionPartialKeyVerification(
+            GUARDIAN_1_ID,
+            GUARDIAN_2_ID,
+            GUARDIAN_2_ID,
+            False,
+        )
+        mediator.receive_backup_verifications([verification1, failed_verification2])
+        state = mediator.get_verification_state()
+
+        # Act
+        mediator.receive_backup_verifications([failed_verification2])
+
+        # Assert
+        self.assertIs(mediator.get_verification_state(), state)
+        self.assertEqual(len(state.failed_verifications), 1)
+
+        # Act
+        challenge_verification2 = ElectionPartialKeyVerification(
+            GUARDIAN_1_ID,
+            GUARDIAN_2_ID,
+            GUARDIAN_1_ID,
+            True,
+        )
+        mediator.receive_backup_verifications([challenge_verification2])
+        new_state = mediator.get_verification_state()
+
+        # Assert
+        self.assertTrue(new_state.all_sent)
+        self.assertTrue(new_state.all_verified)
+        self.assertEqual(len(new_state.failed_verifications), 0)
+        self.assertTrue(mediator.all_backups_verified())